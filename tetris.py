@@ -19,8 +19,11 @@ Run:
 
 import sys
 import os
+import asyncio
 import math
 import random
+import time
+from collections import deque
 import pygame
 from pygame.locals import *
 
@@ -52,6 +55,10 @@ COLORS = {
     'Z': (240, 0, 0),
 }
 
+# Small-int kind codes stored in the board grid (0 = empty)
+KIND_IDX = {k: i for i, k in enumerate(COLORS, start=1)}
+COLOR_BY_IDX = [None] + [COLORS[k] for k in KIND_IDX]
+
 # Tetromino definitions using 4x4 matrices (SRS-like orientation order 0-3)
 # Each shape is a list of rotation states; each rotation is a list of (x,y) cell coords
 PIECES = {
@@ -99,6 +106,20 @@ PIECES = {
     ],
 }
 
+PIECE_KINDS = tuple(PIECES)
+
+# Same shapes frozen into tuples, indexed PIECE_CELLS[kind][rot]
+PIECE_CELLS = {k: tuple(tuple(rot) for rot in v) for k, v in PIECES.items()}
+# ... and by kind code, PIECE_CELLS_BY_CODE[KIND_IDX[kind]][rot]
+PIECE_CELLS_BY_CODE = [None] + [PIECE_CELLS[k] for k in KIND_IDX]
+# (min cx, max cx, max cy) of every shape by kind code, so placement bounds
+# are three compares
+PIECE_BOUNDS_BY_CODE = [None] + [
+    tuple((min(cx for cx, _ in rot), max(cx for cx, _ in rot), max(cy for _, cy in rot))
+          for rot in PIECE_CELLS[k])
+    for k in KIND_IDX
+]
+
 # SRS wall kick data (simplified). For O we don't kick; for I we use I-specific; others use JLSTZ.
 KICKS_JLSTZ = {
     (0,1): [(0,0), (-1,0), (-1,-1), (0,2), (-1,2)],
@@ -121,6 +142,14 @@ KICKS_I = {
     (0,3): [(0,0), (-1,0), (2,0), (-1,-2), (2,1)],
 }
 
+def _kick_table(kicks):
+    # flatten to a tuple indexed by old_rot*4 + new_rot; pairs without kick
+    # data (no rotation) only try the unshifted position
+    return tuple(tuple(kicks.get((old, new), [(0,0)])) for old in range(4) for new in range(4))
+
+KICKS_JLSTZ_TBL = _kick_table(KICKS_JLSTZ)
+KICKS_I_TBL = _kick_table(KICKS_I)
+
 #high score file to display top 5 high scores
 HIGHSCORE_FILE = "highscores.txt"
 
@@ -144,7 +173,7 @@ def save_highscore(initials, score):
         for name, s in scores:
             f.write(f"{name},{s}\n")
 
-def enter_initials(screen, clock, font, font_small, score):
+async def enter_initials(screen, font, font_small, score):
     initials = ""
     entering = True
 
@@ -157,7 +186,7 @@ def enter_initials(screen, clock, font, font_small, score):
         screen.blit(entry_text, (200, 250))
 
         pygame.display.flip()
-        clock.tick(60)
+        await asyncio.sleep(1/60)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -173,9 +202,9 @@ def enter_initials(screen, clock, font, font_small, score):
 
     return initials
 
-def show_highscores(screen, clock, font_small):
+async def show_highscores(screen, font_small):
     showing = True
-    scores = load_highscores()
+    scores = await asyncio.to_thread(load_highscores)
 
     while showing:
         screen.fill((0, 0, 0))
@@ -191,7 +220,7 @@ def show_highscores(screen, clock, font_small):
                 screen.blit(text, (50, 120 + i*40))
 
         pygame.display.flip()
-        clock.tick(60)
+        await asyncio.sleep(1/60)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -201,9 +230,9 @@ def show_highscores(screen, clock, font_small):
                 if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
                     showing = False
 
-def show_game_over_scores(screen, clock, font, font_small):
+async def show_game_over_scores(screen, font, font_small):
     showing = True
-    scores = load_highscores()
+    scores = await asyncio.to_thread(load_highscores)
 
     while showing:
         screen.fill((0, 0, 0))
@@ -223,7 +252,7 @@ def show_game_over_scores(screen, clock, font, font_small):
                 screen.blit(text, (50, 120 + i*40))
 
         pygame.display.flip()
-        clock.tick(60)
+        await asyncio.sleep(1/60)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -234,17 +263,10 @@ def show_game_over_scores(screen, clock, font, font_small):
                     pygame.quit()
                     sys.exit()
                 elif event.key == K_r:
-                    main()
-
-# 7-bag randomizer
-def bag_generator():
-    pieces = list(PIECES.keys())
-    while True:
-        random.shuffle(pieces)
-        for p in pieces:
-            yield p
+                    await main()
+
 # main menu            
-def main_menu(screen, clock, font_large, font_small):
+async def main_menu(screen, font_large, font_small):
     menu_running = True
     selected = 0
     options = ["Start Game", "High Scores", "Controls", "Quit"]
@@ -260,7 +282,7 @@ def main_menu(screen, clock, font_large, font_small):
             screen.blit(text, rect)
 
         pygame.display.flip()
-        clock.tick(60)
+        await asyncio.sleep(1/60)
 
         # Event handling
         for event in pygame.event.get():
@@ -276,15 +298,15 @@ def main_menu(screen, clock, font_large, font_small):
                     if options[selected] == "Start Game":
                         menu_running = False
                     elif options[selected] == "Controls":
-                        show_controls(screen, clock, font_small)
+                        await show_controls(screen, font_small)
                     elif options[selected] =="High Scores":
-                        show_highscores(screen, clock, font_small)
+                        await show_highscores(screen, font_small)
                     elif options[selected] == "Quit":
                         pygame.quit()
                         sys.exit()
 
 #show controls for main menu option
-def show_controls(screen, clock, font_small):
+async def show_controls(screen, font_small):
     showing = True
     controls = [
         "Left / Right: Move",
@@ -307,7 +329,7 @@ def show_controls(screen, clock, font_small):
             screen.blit(text, (50, 120 + i*40))
 
         pygame.display.flip()
-        clock.tick(60)
+        await asyncio.sleep(1/60)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -324,56 +346,87 @@ class Piece:
         # spawn roughly centered; SRS spawn positions vary, but this is fine
         self.x = 3 if kind != 'I' else 3
         self.y = 0
-        self.blocks = PIECES[kind]
+        # per-kind tables picked once here so the hot paths index by int
+        self.kind_code = KIND_IDX[kind]
+        self.cells_table = PIECE_CELLS_BY_CODE[self.kind_code]
+        self.kicks = KICKS_I_TBL if kind == 'I' else KICKS_JLSTZ_TBL
 
     def cells(self, x=None, y=None, rot=None):
         x = self.x if x is None else x
         y = self.y if y is None else y
         rot = self.rot if rot is None else rot
-        return [(x+cx, y+cy) for (cx,cy) in self.blocks[rot]]
+        return [(x+cx, y+cy) for (cx,cy) in self.cells_table[rot]]
 
 class Board:
     def __init__(self, w, h):
         self.w = w
         self.h = h
-        self.grid = [[None for _ in range(w)] for _ in range(h)]
+        # flat row-major grid: grid[y*w + x], 0 = empty, 1..7 = KIND_IDX code
+        self.grid = bytearray(w * h)
+        # row index of the highest filled cell per column (h = empty column)
+        self.column_tops = [h] * w
+        # number of filled cells in each row; a row is full at w
+        self.row_fill = [0] * h
 
     def inside(self, x, y):
         return 0 <= x < self.w and 0 <= y < self.h
 
-    def collides(self, cells):
-        for x, y in cells:
-            if x < 0 or x >= self.w or y >= self.h:
-                return True
-            if y >= 0 and self.grid[y][x] is not None:
+    def collides_at(self, code, rot, ox, oy):
+        # hot path: test one placement of the piece with kind code `code`
+        # without building a cell list
+        g = self.grid
+        w = self.w
+        min_cx, max_cx, max_cy = PIECE_BOUNDS_BY_CODE[code][rot]
+        if ox + min_cx < 0 or ox + max_cx >= w or oy + max_cy >= self.h:
+            return True
+        for cx, cy in PIECE_CELLS_BY_CODE[code][rot]:
+            y = oy + cy
+            if y >= 0 and g[y*w + ox + cx]:
                 return True
         return False
 
     def lock(self, piece):
+        w, grid = self.w, self.grid
+        code = piece.kind_code
+        tops, row_fill = self.column_tops, self.row_fill
+        dirty_rows = set()
         for x, y in piece.cells():
             if 0 <= y < self.h:
-                self.grid[y][x] = piece.kind
-        # return lines cleared
-        full = [i for i,row in enumerate(self.grid) if all(c is not None for c in row)]
+                grid[y*w + x] = code
+                row_fill[y] += 1
+                dirty_rows.add(y)
+                if y < tops[x]:
+                    tops[x] = y
+        # return lines cleared and the rows whose contents changed;
+        # only the rows this piece touched can have become full
+        full = [y for y in sorted(dirty_rows) if row_fill[y] == w]
         cleared = len(full)
-        for i in full:
-            del self.grid[i]
-            self.grid.insert(0, [None for _ in range(self.w)])
-        return cleared
+        if full:
+            # stitch the surviving row runs under `cleared` empty rows in one write
+            parts = [bytes(w * cleared)]
+            start = 0
+            for y in full:
+                parts.append(grid[start*w:y*w])
+                start = y + 1
+            parts.append(grid[start*w:])
+            grid[:] = b''.join(parts)
+            row_fill[:] = [0] * cleared + [n for n in row_fill if n != w]
+            # every row above the lowest cleared row has shifted down
+            dirty_rows.update(range(full[-1] + 1))
+            for x in range(w):
+                tops[x] = self.h - len(grid[x::w].lstrip(b'\0'))
+        return cleared, dirty_rows
 
     def top_out(self):
-        # if any block is above the top after locking, game over
-        for x in range(self.w):
-            if self.grid[0][x] is not None and any(self.grid[y][x] is not None for y in range(0,2)):
-                return True
-        return False
+        # if any block is left in the top row after locking, game over
+        return self.row_fill[0] != 0
 
 class Game:
     def __init__(self):
         self.board = Board(GRID_W, GRID_H)
-        self.bag = bag_generator()
-        self.next_queue = [next(self.bag) for _ in range(5)]
-        self.current = Piece(next(self.bag))
+        self._bag = deque()
+        self.next_queue = [self._next_piece() for _ in range(5)]
+        self.current = Piece(self._next_piece())
         self.hold = None
         self.hold_used = False
         self.score = 0
@@ -383,21 +436,38 @@ class Game:
         self.gravity_timer = 0.0
         self.game_over = False
         self.paused = False
+        # locked blocks are cached on their own surface; only rows that
+        # changed since the last frame are repainted
+        self._empty_board = render_empty_board()
+        self._locked_surface = self._empty_board.copy()
+        self._dirty_rows = set()
+        self._board_dirty = False
+        # label -> (value, surface) for the score/level/lines readouts
+        self._hud_text = {}
+        # what the side panel showed last frame, to tell when it changed
+        self._panel_state = None
         self.spawn_new()
 
+    def _next_piece(self):
+        # 7-bag randomizer: deal out a freshly shuffled set of all kinds
+        if not self._bag:
+            self._bag.extend(random.sample(PIECE_KINDS, 7))
+        return self._bag.popleft()
+
     def spawn_new(self):
         # move next piece into current, refill queue
-        self.current = Piece(self.next_queue.pop(0) if self.next_queue else next(self.bag))
-        self.next_queue.append(next(self.bag))
+        self.current = Piece(self.next_queue.pop(0) if self.next_queue else self._next_piece())
+        self.next_queue.append(self._next_piece())
         self.hold_used = False
         # spawn adjustment if initial position collides
-        if self.board.collides(self.current.cells()):
+        cur = self.current
+        if self.board.collides_at(cur.kind_code, cur.rot, cur.x, cur.y):
             # tiny nudge down or right if possible
             for dy in (0, -1, 1):
                 for dx in (0, -1, 1):
-                    if not self.board.collides(self.current.cells(self.current.x+dx, self.current.y+dy)):
-                        self.current.x += dx
-                        self.current.y += dy
+                    if not self.board.collides_at(cur.kind_code, cur.rot, cur.x+dx, cur.y+dy):
+                        cur.x += dx
+                        cur.y += dy
                         return
             # if still colliding, game over
             self.game_over = True
@@ -421,7 +491,7 @@ class Game:
         if self.game_over or self.paused:
             return False
         nx, ny = self.current.x + dx, self.current.y + dy
-        if not self.board.collides(self.current.cells(nx, ny)):
+        if not self.board.collides_at(self.current.kind_code, self.current.rot, nx, ny):
             self.current.x, self.current.y = nx, ny
             return True
         return False
@@ -431,12 +501,10 @@ class Game:
             return
         old_rot = self.current.rot
         new_rot = (old_rot + (1 if dir > 0 else -1)) % 4
-        kicks = KICKS_I if self.current.kind == 'I' else KICKS_JLSTZ
-        key = (old_rot, new_rot)
-        candidates = kicks.get(key, [(0,0)])
+        candidates = self.current.kicks[old_rot*4 + new_rot]
+        code, x, y = self.current.kind_code, self.current.x, self.current.y
         for dx, dy in candidates:
-            cells = self.current.cells(self.current.x + dx, self.current.y + dy, new_rot)
-            if not self.board.collides(cells):
+            if not self.board.collides_at(code, new_rot, x + dx, y + dy):
                 self.current.rot = new_rot
                 self.current.x += dx
                 self.current.y += dy
@@ -453,11 +521,14 @@ class Game:
             self.hold, self.current = self.current.kind, Piece(self.hold)
             # reset position/rotation
             self.current.x, self.current.y, self.current.rot = 3, 0, 0
-            if self.board.collides(self.current.cells()):
+            cur = self.current
+            if self.board.collides_at(cur.kind_code, cur.rot, cur.x, cur.y):
                 self.game_over = True
 
     def lock_and_clear(self):
-        cleared = self.board.lock(self.current)
+        cleared, dirty_rows = self.board.lock(self.current)
+        self._dirty_rows.update(dirty_rows)
+        self._board_dirty = True
         if cleared:
             # basic Tetris scoring
             scores = {1: 100, 2: 300, 3: 500, 4: 800}
@@ -476,7 +547,7 @@ class Game:
         # classic-like: speed increases with level, min clamp
         return max(0.10, 0.55 - (self.level - 1) * 0.05)
 
-    def tick(self, dt, keys):
+    def tick(self, dt):
         if self.game_over or self.paused:
             return
         self.gravity_timer += dt
@@ -487,60 +558,120 @@ class Game:
 
     def ghost_y(self):
         # compute where the piece would land
-        y = self.current.y
-        while not self.board.collides(self.current.cells(self.current.x, y+1)):
+        x, y = self.current.x, self.current.y
+        code, rot = self.current.kind_code, self.current.rot
+        tops = self.board.column_tops
+        cells = self.current.cells_table[rot]
+        if all(y + cy < tops[x + cx] for cx, cy in cells):
+            # nothing between the piece and each column's top block
+            return min(tops[x + cx] - cy - 1 for cx, cy in cells)
+        # piece is tucked under an overhang; walk down the slow way
+        collides_at = self.board.collides_at
+        while not collides_at(code, rot, x, y+1):
             y += 1
         return y
 
+    def _render_locked(self):
+        # returns True if the locked surface was repainted
+        if not self._board_dirty:
+            return False
+        w, grid = self.board.w, self.board.grid
+        surf = self._locked_surface
+        ops = []
+        for y in self._dirty_rows:
+            strip = pygame.Rect(0, y*BLOCK, w*BLOCK, BLOCK)
+            surf.fill((0, 0, 0, 0), strip)
+            surf.blit(self._empty_board, strip, strip)
+            ops.extend((SPRITE_BY_IDX[k], (x*BLOCK, y*BLOCK))
+                       for x, k in enumerate(grid[y*w:(y+1)*w]) if k)
+        surf.blits(ops, doreturn=False)
+        self._dirty_rows.clear()
+        self._board_dirty = False
+        return True
+
 # ------------ Drawing helpers ------------ #
-def draw_cell(surf, x, y, color, inset=2, alpha=None):
-    rect = pygame.Rect(BORDER + x*BLOCK, TOP_MARGIN + y*BLOCK, BLOCK, BLOCK)
-    if alpha is not None:
+def _build_block_sprites(inset=2):
+    # one pre-rendered cell per piece kind, plus the translucent ghost cell
+    sprites = {}
+    for kind, color in COLORS.items():
         s = pygame.Surface((BLOCK, BLOCK), pygame.SRCALPHA)
-        c = (*color, alpha)
-        pygame.draw.rect(s, c, (inset, inset, BLOCK-2*inset, BLOCK-2*inset), border_radius=6)
-        surf.blit(s, rect.topleft)
-    else:
-        pygame.draw.rect(surf, (12,12,16), rect, border_radius=6)
-        inner = rect.inflate(-inset*2, -inset*2)
-        pygame.draw.rect(surf, color, inner, border_radius=6)
+        rect = s.get_rect()
+        pygame.draw.rect(s, (12,12,16), rect, border_radius=6)
+        pygame.draw.rect(s, color, rect.inflate(-inset*2, -inset*2), border_radius=6)
+        sprites[kind] = s
+    ghost = pygame.Surface((BLOCK, BLOCK), pygame.SRCALPHA)
+    pygame.draw.rect(ghost, (*GHOST, 70), (inset, inset, BLOCK-2*inset, BLOCK-2*inset), border_radius=6)
+    return sprites, ghost
+
+BLOCK_SPRITES, GHOST_SPRITE = _build_block_sprites()
+SPRITE_BY_IDX = [None] + [BLOCK_SPRITES[k] for k in KIND_IDX]
+
+def _render_mini(shape):
+    # next/hold preview of a piece in spawn rotation, plus the offset that
+    # centers it on a preview slot
+    blocks = PIECES[shape][0]
+    xs = [c[0] for c in blocks]
+    ys = [c[1] for c in blocks]
+    w, h = max(xs) - min(xs) + 1, max(ys) - min(ys) + 1
+    surf = pygame.Surface((w*BLOCK, h*BLOCK), pygame.SRCALPHA)
+    for (cx, cy) in blocks:
+        rect = pygame.Rect((cx - min(xs)) * BLOCK, (cy - min(ys)) * BLOCK, BLOCK-8, BLOCK-8)
+        pygame.draw.rect(surf, COLORS[shape], rect, border_radius=6)
+    return surf, (15 - (w*BLOCK)//2, 15 - (h*BLOCK)//2)
+
+MINI_SPRITES = {k: _render_mini(k) for k in PIECES}
+
+# translucent full-window overlays for pause and game over
+PAUSE_OVERLAY = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+PAUSE_OVERLAY.fill((0,0,0,120))
+GAMEOVER_OVERLAY = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+GAMEOVER_OVERLAY.fill((0,0,0,140))
+
+# rendered surfaces for text that never changes, keyed by (font, text, color)
+HUD_CACHE = {}
+
+def render_static(font, text, color):
+    key = (font, text, color)
+    surf = HUD_CACHE.get(key)
+    if surf is None:
+        surf = HUD_CACHE[key] = font.render(text, True, color)
+    return surf
+
+def render_empty_board():
+    # board background + grid lines, drawn once per game
+    # (one pixel larger so the closing grid lines fit)
+    surf = pygame.Surface((GRID_W*BLOCK + 1, GRID_H*BLOCK + 1), pygame.SRCALPHA)
+    pygame.draw.rect(surf, GRID_BG, (0, 0, GRID_W*BLOCK, GRID_H*BLOCK), border_radius=8)
+    for x in range(GRID_W+1):
+        pygame.draw.line(surf, GRID_LINE, (x*BLOCK, 0), (x*BLOCK, GRID_H*BLOCK))
+    for y in range(GRID_H+1):
+        pygame.draw.line(surf, GRID_LINE, (0, y*BLOCK), (GRID_W*BLOCK, y*BLOCK))
+    return surf
 
 def draw_board(screen, game, font_small):
-    # board background
+    # returns the screen rects that changed since the last frame
     board_rect = pygame.Rect(BORDER, TOP_MARGIN, GRID_W*BLOCK, GRID_H*BLOCK)
-    pygame.draw.rect(screen, GRID_BG, board_rect, border_radius=8)
-    # grid lines
-    for x in range(GRID_W+1):
-        pygame.draw.line(screen, GRID_LINE,
-            (BORDER + x*BLOCK, TOP_MARGIN),
-            (BORDER + x*BLOCK, TOP_MARGIN + GRID_H*BLOCK))
-    for y in range(GRID_H+1):
-        pygame.draw.line(screen, GRID_LINE,
-            (BORDER, TOP_MARGIN + y*BLOCK),
-            (BORDER + GRID_W*BLOCK, TOP_MARGIN + y*BLOCK))
-
-    # locked blocks
-    for y in range(GRID_H):
-        for x in range(GRID_W):
-            k = game.board.grid[y][x]
-            if k:
-                draw_cell(screen, x, y, COLORS[k])
-
-    # ghost piece
-    gy = game.ghost_y()
-    for (cx, cy) in game.current.cells(game.current.x, gy):
-        if cy >= 0:
-            draw_cell(screen, cx, cy, GHOST, alpha=70)
+    # background, grid lines and locked blocks
+    repainted = game._render_locked()
+    locked_rect = screen.blit(game._locked_surface, (BORDER, TOP_MARGIN))
 
-    # current piece
-    for (cx, cy) in game.current.cells():
-        if cy >= 0:
-            draw_cell(screen, cx, cy, COLORS[game.current.kind])
+    # ghost piece, then current piece on top
+    gy = game.ghost_y()
+    ops = [(GHOST_SPRITE, (BORDER + cx*BLOCK, TOP_MARGIN + cy*BLOCK))
+           for (cx, cy) in game.current.cells(game.current.x, gy) if cy >= 0]
+    sprite = BLOCK_SPRITES[game.current.kind]
+    ops += [(sprite, (BORDER + cx*BLOCK, TOP_MARGIN + cy*BLOCK))
+            for (cx, cy) in game.current.cells() if cy >= 0]
+    dirty = screen.blits(ops)
 
     # border
     pygame.draw.rect(screen, (80,80,95), board_rect, 2, border_radius=8)
+    if repainted:
+        dirty.append(locked_rect)
+    return dirty
 
 def draw_panel(screen, game, font, font_small):
+    # returns the screen rects that changed since the last frame
     x0 = BORDER*2 + GRID_W*BLOCK
     y0 = TOP_MARGIN
     panel = pygame.Rect(x0, y0, SIDE_PANEL, GRID_H*BLOCK)
@@ -548,10 +679,13 @@ def draw_panel(screen, game, font, font_small):
     pygame.draw.rect(screen, (80,80,95), panel, 2, border_radius=8)
 
     def text(label, val, y):
-        surf = font_small.render(f"{label}: {val}", True, TEXT)
-        screen.blit(surf, (x0 + 14, y))
+        # numbers are re-rendered only when they change
+        cached = game._hud_text.get(label)
+        if cached is None or cached[0] != val:
+            cached = game._hud_text[label] = (val, font_small.render(f"{label}: {val}", True, TEXT))
+        screen.blit(cached[1], (x0 + 14, y))
 
-    title = font.render("TETRIS", True, TEXT)
+    title = render_static(font, "TETRIS", TEXT)
     screen.blit(title, (x0 + 14, y0 + 10))
 
     text("Score", game.score, y0 + 60)
@@ -559,29 +693,19 @@ def draw_panel(screen, game, font, font_small):
     text("Lines", game.lines, y0 + 116)
 
     # Next queue
-    nq = font_small.render("Next", True, TEXT)
+    nq = render_static(font_small, "Next", TEXT)
     screen.blit(nq, (x0 + 14, y0 + 150))
 
     def draw_mini(shape, px, py):
-        blocks = PIECES[shape][0]
-        # center mini previews
-        xs = [c[0] for c in blocks]
-        ys = [c[1] for c in blocks]
-        w, h = max(xs) - min(xs) + 1, max(ys) - min(ys) + 1
-        ox = px - (w*BLOCK)//2 + 15
-        oy = py - (h*BLOCK)//2 + 15
-        for (cx, cy) in blocks:
-            rx = (cx - min(xs)) * BLOCK + ox
-            ry = (cy - min(ys)) * BLOCK + oy
-            rect = pygame.Rect(rx, ry, BLOCK-8, BLOCK-8)
-            pygame.draw.rect(screen, COLORS[shape], rect, border_radius=6)
+        surf, (dx, dy) = MINI_SPRITES[shape]
+        screen.blit(surf, (px + dx, py + dy))
 
     ny = y0 + 180
     for i, s in enumerate(game.next_queue[:3]):
         draw_mini(s, x0 + SIDE_PANEL//2, ny + i*60)
 
     # Hold
-    hold_label = font_small.render("Hold", True, TEXT)
+    hold_label = render_static(font_small, "Hold", TEXT)
     screen.blit(hold_label, (x0 + 14, y0 + 340))#480
     if game.hold:
         draw_mini(game.hold, x0 + SIDE_PANEL//2, y0 + 390)#520
@@ -596,17 +720,23 @@ def draw_panel(screen, game, font, font_small):
         "Q/Esc: quit",
     ]
     for i, line in enumerate(help_lines):
-        s = font_small.render(line, True, (200,200,210))
+        s = render_static(font_small, line, (200,200,210))
         screen.blit(s, (x0 + 14, y0 + 440 + i*20))
 
+    state = (game.score, game.level, game.lines, tuple(game.next_queue[:3]), game.hold)
+    if state == game._panel_state:
+        return []
+    game._panel_state = state
+    return [panel]
+
 def draw_header(screen, font_small):
-    hdr = font_small.render("Python + Pygame — Tetris", True, (180, 180, 195))
+    hdr = render_static(font_small, "Python + Pygame — Tetris", (180, 180, 195))
     screen.blit(hdr, (BORDER, 10))
 
 def reset_game():
     return Game()
 
-def main():
+async def main():
     pygame.init()
     pygame.mixer.init()
 
@@ -618,41 +748,65 @@ def main():
     font = pygame.font.SysFont("arialrounded", 28, bold=True)
     font_small = pygame.font.SysFont("arial", 18)
     font_large = pygame.font.SysFont("arial", 50)
-    main_menu(screen, clock, font_large, font_small)
+    await main_menu(screen, font_large, font_small)
 
     #load bgm
-    pygame.mixer.music.load("Tetris 99 - Main Theme.ogg")
+    await asyncio.to_thread(pygame.mixer.music.load, "Tetris 99 - Main Theme.ogg")
     pygame.mixer.music.set_volume(0.5)
     pygame.mixer.music.play(-1)
     
     #start game
     game = Game()
+    try_move = game.try_move
 
     # Repeat left/right movement with key hold
     move_delay = 0.12
     move_timer = 0.0
     move_dir = 0
 
+    paused_snapshot = None
+    # present only the rects that changed (plus last frame's, so the old
+    # piece footprint is restored); flip the whole window on transitions
+    full_redraw = True
+    prev_dirty = []
+
+    # hot lookups bound once outside the frame loop
+    event_get = pygame.event.get
+    display_flip = pygame.display.flip
+    display_update = pygame.display.update
+    tick = clock.tick
+    monotonic = time.monotonic
+
     running = True
+    last = monotonic()
     while running:
-        dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
+        # clock.tick only rate-limits; dt comes from the monotonic clock
+        tick(FPS)
+        now = monotonic()
+        dt = now - last
+        last = now
+        for event in event_get():
             if event.type == QUIT:
                 running = False
+            elif event.type == WINDOWEXPOSED:
+                full_redraw = True
             elif event.type == KEYDOWN:
                 if event.key in (K_ESCAPE, K_q):
                     running = False
                 elif event.key == K_p:
                     game.paused = not game.paused
+                    full_redraw = True
                 elif event.key == K_r:
                     game = reset_game()
+                    try_move = game.try_move
+                    full_redraw = True
                 elif not game.paused and not game.game_over:
                     if event.key == K_LEFT:
-                        game.try_move(-1, 0)
+                        try_move(-1, 0)
                         move_dir = -1
                         move_timer = 0
                     elif event.key == K_RIGHT:
-                        game.try_move(1, 0)
+                        try_move(1, 0)
                         move_dir = 1
                         move_timer = 0
                     elif event.key == K_DOWN:
@@ -674,48 +828,60 @@ def main():
         if move_dir != 0 and not game.paused and not game.game_over:
             move_timer += dt
             if move_timer >= move_delay:
-                if game.try_move(move_dir, 0):
+                if try_move(move_dir, 0):
                     move_timer -= move_delay  # keep it smooth
                 else:
                     move_timer = 0.0
 
         # Tick gravity
-        game.tick(dt, pygame.key.get_pressed())
+        game.tick(dt)
 
         # Draw
-        screen.fill(BG)
-        draw_header(screen, font_small)
-        draw_board(screen, game, font_small)
-        draw_panel(screen, game, font, font_small)
+        if not game.paused:
+            paused_snapshot = None
+        if paused_snapshot is not None:
+            # nothing moves while paused; reuse the frame captured on entry
+            screen.blit(paused_snapshot, (0,0))
+            dirty_rects = []
+        else:
+            screen.fill(BG)
+            draw_header(screen, font_small)
+            dirty_rects = draw_board(screen, game, font_small)
+            dirty_rects += draw_panel(screen, game, font, font_small)
 
         # Overlays
-        if game.paused:
-            s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            s.fill((0,0,0,120))
-            screen.blit(s, (0,0))
-            t = font.render("Paused", True, TEXT)
+        if game.paused and paused_snapshot is None:
+            screen.blit(PAUSE_OVERLAY, (0,0))
+            t = render_static(font, "Paused", TEXT)
             screen.blit(t, (WIDTH//2 - t.get_width()//2, HEIGHT//2 - t.get_height()//2))
+            paused_snapshot = screen.copy()
         if game.game_over:
-            s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            s.fill((0,0,0,140))
-            screen.blit(s, (0,0))
+            full_redraw = True
+            screen.blit(GAMEOVER_OVERLAY, (0,0))
 
             # --- High score logic ---
-            scores = load_highscores()
+            scores = await asyncio.to_thread(load_highscores)
             # Check if qualifies for leaderboard
             if len(scores) < 5 or game.score > scores[-1][1]:
-                initials = enter_initials(screen, clock, font, font_small, game.score)
-                save_highscore(initials, game.score)
+                initials = await enter_initials(screen, font, font_small, game.score)
+                await asyncio.to_thread(save_highscore, initials, game.score)
                 game.score = 0
             
-            show_game_over_scores(screen, clock, font, font_small)
+            await show_game_over_scores(screen, font, font_small)
 
 
 
-        pygame.display.flip()
+        if full_redraw:
+            display_flip()
+            full_redraw = False
+        else:
+            display_update(prev_dirty + dirty_rects)
+        prev_dirty = dirty_rects
+        # let pending file I/O and other tasks run once per frame
+        await asyncio.sleep(0)
 
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())